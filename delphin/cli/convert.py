@@ -11,7 +11,7 @@ import argparse
 import warnings
 
 from delphin.exceptions import PyDelphinWarning
-from delphin.commands import convert
+from delphin.commands import convert, convert_iter
 from delphin import util
 
 
@@ -47,19 +47,25 @@ def call_convert(args):
                 args.indent = None
             else:
                 args.indent = int(args.indent)
-        print(convert(
-            args.PATH,
-            vars(args)['from'],  # vars() to avoid syntax error
-            args.to,
+        kwargs = dict(
             properties=(not args.no_properties),
             lnk=(not args.no_lnk),
-            color=color,
             indent=args.indent,
             select=args.select,
             # below are format-specific kwargs
             show_status=args.show_status,
             predicate_modifiers=args.predicate_modifiers,
-            semi=args.semi))
+            semi=args.semi)
+        source_fmt = vars(args)['from']  # vars() to avoid syntax error
+        if color:
+            print(convert(args.PATH, source_fmt, args.to,
+                          color=color, **kwargs))
+        else:
+            # stream the output when it doesn't need to be highlighted
+            for part in convert_iter(args.PATH, source_fmt, args.to,
+                                     **kwargs):
+                sys.stdout.write(part)
+            sys.stdout.write('\n')
 
 
 def _list_codecs(verbose):
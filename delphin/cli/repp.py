@@ -47,7 +47,8 @@ def call_repp(args):
         active=args.a,
         format=args.format,
         color=color,
-        trace_level=1 if args.trace else 0)
+        trace_level=1 if args.trace else 0,
+        processes=args.processes)
 
 
 parser.set_defaults(func=call_repp)
@@ -76,3 +77,6 @@ parser.add_argument(
 parser.add_argument(
     '--trace', action='store_true',
     help='print each step that modifies an input string')
+parser.add_argument(
+    '-j', '--processes', metavar='N', type=int, default=1,
+    help='number of processes to tokenize with (default: 1)')
@@ -143,19 +143,22 @@ def to_dict(d, properties=True, lnk=True):
     """
     nodes = []
     for node in d.nodes:
-        n = dict(nodeid=node.id,
-                 predicate=node.predicate)
-        if properties and node.sortinfo:
-            n['sortinfo'] = node.sortinfo
-        if node.carg is not None:
-            n['carg'] = node.carg
+        n = {'nodeid': node.id, 'predicate': node.predicate}
+        if properties:
+            sortinfo = node.sortinfo  # computed on each access
+            if sortinfo:
+                n['sortinfo'] = sortinfo
+        carg = node.carg
+        if carg is not None:
+            n['carg'] = carg
         if lnk:
             if node.lnk:
                 n['lnk'] = {'from': node.cfrom, 'to': node.cto}
-            if node.surface:
-                n['surface'] = node.surface
-            if node.base:
-                n['base'] = node.base
+            surface, base = node.surface, node.base
+            if surface:
+                n['surface'] = surface
+            if base:
+                n['base'] = base
         nodes.append(n)
     links = []
     for link in d.links:
@@ -185,27 +188,25 @@ def from_dict(d):
     def _lnk(x):
         return None if x is None else Lnk.charspan(x['from'], x['to'])
     nodes = []
-    for node in d.get('nodes', []):
-        properties = dict(node.get('sortinfo', {}))  # make a copy
-        type = None
-        if CVARSORT in properties:
-            type = properties.pop(CVARSORT)
+    for node in d.get('nodes', ()):
+        sortinfo = node.get('sortinfo')
+        properties = dict(sortinfo) if sortinfo else {}  # make a copy
+        type = properties.pop(CVARSORT, None)
+        lnk = node.get('lnk')
+        if lnk is not None:
+            lnk = Lnk.charspan(lnk['from'], lnk['to'])
         nodes.append(Node(
             node['nodeid'],
             node['predicate'],
             type=type,
             properties=properties,
             carg=node.get('carg'),
-            lnk=_lnk(node.get('lnk')),
+            lnk=lnk,
             surface=node.get('surface'),
             base=node.get('base')))
-    links = []
-    for link in d.get('links', []):
-        links.append(Link(
-            link['from'],
-            link['to'],
-            link.get('rargname'),
-            link.get('post')))
+    links = [Link(link['from'], link['to'],
+                  link.get('rargname'), link.get('post'))
+             for link in d.get('links', ())]
     return DMRS(
         top=d.get('top'),
         index=d.get('index'),
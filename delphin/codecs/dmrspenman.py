@@ -165,8 +165,7 @@ def to_triples(d, properties=True, lnk=True):
     complete = True
 
     idmap = {}
-    quantifiers = {node.id for node in d.nodes
-                   if d.is_quantifier(node.id)}
+    quantifiers = d.quantifier_ids()
     for i, node in enumerate(d.nodes, 1):
         if node.id in quantifiers:
             idmap[node.id] = 'q' + str(i)
@@ -181,9 +181,7 @@ def _decode_node(elem):
     #           base      CDATA #IMPLIED
     #           carg CDATA #IMPLIED >
     sortinfo = _decode_sortinfo(elem.find('sortinfo'))
-    type = None
-    if CVARSORT in sortinfo:
-        type = sortinfo.pop(CVARSORT)
+    type = sortinfo.pop(CVARSORT, None)
     return Node(id=int(elem.get('nodeid')),
                 predicate=_decode_pred(elem.find('*[1]')),
                 type=type,
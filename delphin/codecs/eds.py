@@ -5,6 +5,7 @@ Serialization functions for the "native" EDS format.
 """
 
 from pathlib import Path
+import sys
 
 from delphin import variable
 from delphin.lnk import Lnk
@@ -217,7 +218,7 @@ def _decode_edges(start, lexer):
     if lexer.peek()[0] != RBRACKET:
         while True:
             role, end = lexer.expect_type(SYMBOL, SYMBOL)
-            edges[role.upper()] = end
+            edges[sys.intern(role.upper())] = end
             if not lexer.accept_type(COMMA):
                 break
     lexer.expect_type(RBRACKET)
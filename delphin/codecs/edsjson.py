@@ -147,14 +147,15 @@ def to_dict(eds, properties=True, lnk=True):
         }
         if lnk and node.lnk is not None:
             nd['lnk'] = {'from': node.cfrom, 'to': node.cto}
-        if node.type is not None:
-            nd['type'] = node.type
+        type, carg = node.type, node.carg
+        if type is not None:
+            nd['type'] = type
         if properties:
             props = node.properties
             if props:
                 nd['properties'] = props
-        if node.carg is not None:
-            nd['carg'] = node.carg
+        if carg is not None:
+            nd['carg'] = carg
         nodes[node.id] = nd
     return {'top': eds.top, 'nodes': nodes}
 
@@ -145,31 +145,33 @@ def to_dict(mrs, properties=True, lnk=True):
         if lnk:
             if ep.lnk:
                 d['lnk'] = {'from': ep.cfrom, 'to': ep.cto}
-            if ep.surface:
-                d['surface'] = ep.surface
-            if ep.base:
-                d['base'] = ep.base
+            surface, base = ep.surface, ep.base
+            if surface:
+                d['surface'] = surface
+            if base:
+                d['base'] = base
         return d
 
-    def _hcons(hc):
-        return {'relation': hc.relation, 'high': hc.hi, 'low': hc.lo}
+    # constraints and variables are built inline rather than with
+    # helper functions to avoid a function call per item
+    constraints = [{'relation': hc.relation, 'high': hc.hi, 'low': hc.lo}
+                   for hc in mrs.hcons]
+    constraints.extend(
+        {'relation': ic.relation, 'left': ic.left, 'right': ic.right}
+        for ic in mrs.icons)
 
-    def _icons(ic):
-        return {'relation': ic.relation, 'left': ic.left, 'right': ic.right}
-
-    def _var(v):
-        d = {'type': variable.type(v)}
-        if properties and mrs.variables.get(v):
-            d['properties'] = dict(mrs.variables[v])
-        return d
+    variables = {}
+    for v, props in mrs.variables.items():
+        vd = variables[v] = {'type': variable.type(v)}
+        if properties and props:
+            vd['properties'] = dict(props)
 
     d = dict(
         top=mrs.top,
         index=mrs.index,
         relations=list(map(_ep, mrs.rels)),
-        constraints=(list(map(_hcons, mrs.hcons))
-                     + list(map(_icons, mrs.icons))),
-        variables={v: _var(v) for v in mrs.variables})
+        constraints=constraints,
+        variables=variables)
     # if mrs.lnk is not None: d['lnk'] = mrs.lnk
     # if mrs.surface is not None: d['surface'] = mrs.surface
     # if mrs.identifier is not None: d['identifier'] = mrs.identifier
@@ -6,6 +6,7 @@ MRX (XML for MRS) serialization and deserialization.
 
 import io
 import re
+import sys
 from pathlib import Path
 import xml.etree.ElementTree as etree
 
@@ -242,7 +243,7 @@ def _decode_args(elem, variables=None):
     # other args (including IVs) have var values.
     args = {}
     for e in elem.findall('fvpair'):
-        rargname = e.find('rargname').text.upper()
+        rargname = sys.intern(e.find('rargname').text.upper())
         if e.find('constant') is not None:
             argval = e.find('constant').text
         elif e.find('var') is not None:
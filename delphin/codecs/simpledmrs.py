@@ -5,6 +5,7 @@ Serialization for the SimpleDMRS format.
 """
 
 from pathlib import Path
+import sys
 
 from delphin.lnk import Lnk
 from delphin.dmrs import (
@@ -235,7 +236,9 @@ def _decode_link(start, lexer):
     role = lexer.accept_type(SYMBOL)
     _, post, _, end, _ = lexer.expect_type(
         SLASH, SYMBOL, ARROW, SYMBOL, SEMICOLON)
-    return Link(int(start), int(end), role, post)
+    if role is not None:
+        role = sys.intern(role)
+    return Link(int(start), int(end), role, sys.intern(post))
 
 
 ##############################################################################
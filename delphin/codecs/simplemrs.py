@@ -5,6 +5,7 @@ Serialization functions for the SimpleMRS format.
 """
 
 from pathlib import Path
+import sys
 
 from delphin.util import Lexer
 from delphin import predicate
@@ -221,15 +222,13 @@ def _decode_lnk(lexer):
 
 def _decode_variable(lexer, variables):
     var = lexer.expect_type(SYMBOL).lower()
-    if var not in variables:
-        variables[var] = {}
-    props = variables[var]
+    props = variables.setdefault(var, {})
     if lexer.accept_type(LBRACK):
         lexer.accept_type(SYMBOL)  # variable type
         feature = lexer.accept_type(FEATURE)
         while feature is not None:
             value = lexer.expect_type(SYMBOL)
-            props[feature.upper()] = value.lower()
+            props[sys.intern(feature.upper())] = value.lower()
             feature = lexer.accept_type(FEATURE)
         lexer.expect_type(RBRACK)
     return var
@@ -247,7 +246,7 @@ def _decode_rel(lexer, variables):
     # any remaining are arguments or a constant
     role = lexer.accept_type(FEATURE)
     while role is not None:
-        role = role.upper()
+        role = sys.intern(role.upper())
         if role == 'CARG':
             value = lexer.expect_type(DQSTRING)
         else:
@@ -3,12 +3,16 @@
 PyDelphin API counterparts to the ``delphin`` commands.
 """
 
-from typing import Union, Iterator, IO, Dict, Any
+from typing import Union, Iterator, IO, Dict, Any, Optional
+import os
 import sys
+import re
 from pathlib import Path
 import tempfile
 import logging
 import warnings
+from functools import lru_cache
+from itertools import chain
 
 from delphin import exceptions
 from delphin import tsdb, itsdb, tsql
@@ -86,6 +90,65 @@ def convert(path: Union[util.PathLike, IO[str]],
     Returns:
         str: the converted representation
     """
+    highlight = _get_highlighter(color, _parse_format_name(target_fmt)[0])
+    parts = convert_iter(
+        path,
+        source_fmt,
+        target_fmt,
+        select=select,
+        properties=properties,
+        lnk=lnk,
+        indent=indent,
+        show_status=show_status,
+        predicate_modifiers=predicate_modifiers,
+        semi=semi)
+    return highlight(''.join(parts))
+
+
+def convert_iter(path: Union[util.PathLike, IO[str]],
+                 source_fmt: str,
+                 target_fmt: str,
+                 select: str = 'result.mrs',
+                 properties: bool = True,
+                 lnk: bool = True,
+                 indent: int = None,
+                 show_status: bool = False,
+                 predicate_modifiers: bool = False,
+                 semi: Union[SemI, util.PathLike] = None) -> Iterator[str]:
+    """
+    Convert representations and yield the output incrementally.
+
+    This function is like :func:`convert` except that instead of
+    returning the full output as a single string, it yields the
+    header, each converted representation (and any joiners), and the
+    footer as they are produced, so large inputs can be written to a
+    stream without buffering the whole result. Syntax highlighting
+    is not available. The arguments are validated when the function
+    is called, not when the iterator is first consumed.
+
+    Args:
+        path (str, ~pathlib.Path, open file): filename, testsuite
+            directory, open file, or stream of input representations
+        source_fmt (str): convert from this format
+        target_fmt (str): convert to this format
+        select (str): TSQL query for selecting data (ignored if *path*
+            is not a testsuite directory; default: `"result:mrs"`)
+        properties (bool): include morphosemantic properties if `True`
+            (default: `True`)
+        lnk (bool): include lnk surface alignments and surface strings
+            if `True` (default: `True`)
+        indent (int): specifies an explicit number of spaces
+            for indentation
+        show_status (bool): show disconnected EDS nodes (ignored if
+            *target_fmt* is not `"eds"`; default: `False`)
+        predicate_modifiers (bool): apply EDS predicate modification
+            for certain kinds of patterns (ignored if *target_fmt* is
+            not an EDS format; default: `False`)
+        semi: a :class:`delphin.semi.SemI` object or path to a SEM-I
+            (ignored if *target_fmt* is not ``indexedmrs``)
+    Yields:
+        str: parts of the converted output
+    """
     if path is None:
         path = sys.stdin
 
@@ -93,22 +156,17 @@ def convert(path: Union[util.PathLike, IO[str]],
     source_fmt, source_lines = _parse_format_name(source_fmt)
     target_fmt, target_lines = _parse_format_name(target_fmt)
     # process other arguments
-    highlight = _get_highlighter(color, target_fmt)
     source_codec = _get_codec(source_fmt)
     target_codec = _get_codec(target_fmt)
     converter = _get_converter(source_codec, target_codec, predicate_modifiers)
 
-    if len(tsql.inspect_query('select ' + select)['projection']) != 1:
+    if len(_inspect_select(select)['projection']) != 1:
         raise CommandError(
             'Exactly 1 column must be given in selection query: '
             '(e.g., result.mrs)')
 
     if semi is not None and not isinstance(semi, SemI):
-        # lets ignore the SEM-I warnings until questions regarding
-        # valid SEM-Is are resolved
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore')
-            semi = load_semi(semi)
+        semi = _load_semi(semi)
 
     # read
     kwargs: Dict[str, Any] = {}
@@ -136,32 +194,10 @@ def convert(path: Union[util.PathLike, IO[str]],
     # accommodate streaming output. Otherwise it is the same as
     # calling the following:
     #     target_codec.dumps(xs, **kwargs)
-    if target_lines:
-        header = footer = ''
-        joiner = '\n'
-    else:
-        header = getattr(target_codec, 'HEADER', '')
-        joiner = getattr(target_codec, 'JOINER', ' ')
-        footer = getattr(target_codec, 'FOOTER', '')
-        if indent is not None:
-            if header:
-                header += '\n'
-            joiner = joiner.strip() + '\n'
-            if footer:
-                footer = '\n' + footer
+    header, joiner, footer = _get_header_joiner_footer(
+        target_codec, target_lines, indent is not None)
 
-    parts = []
-    for x in xs:
-        try:
-            s = target_codec.encode(x, **kwargs)
-        except (PyDelphinException, KeyError, IndexError):
-            logger.exception('could not convert representation')
-        else:
-            parts.append(s)
-
-    output = highlight(header + joiner.join(parts) + footer)
-
-    return output
+    return _iter_encode(xs, target_codec, kwargs, header, joiner, footer)
 
 
 def _parse_format_name(name):
@@ -182,7 +218,10 @@ def _get_highlighter(color, target_fmt):
     return highlight
 
 
+@lru_cache(maxsize=None)
 def _get_codec(name):
+    # codec lookup walks the delphin.codecs namespace, so only do it
+    # once per name
     try:
         codec = util.import_codec(name)
     except KeyError as exc:
@@ -190,6 +229,7 @@ def _get_codec(name):
     return codec
 
 
+@lru_cache(maxsize=None)
 def _get_converter(source_codec, target_codec, predicate_modifiers):
     src_rep = source_codec.CODEC_INFO['representation'].lower()
     tgt_rep = target_codec.CODEC_INFO['representation'].lower()
@@ -225,21 +265,76 @@ def _get_converter(source_codec, target_codec, predicate_modifiers):
     return converter
 
 
+def _load_semi(path):
+    # SEM-Is are expensive to parse and the same one is often used for
+    # many conversions, so cache them by path and the modification
+    # times of the file and every file it includes
+    path = Path(path).expanduser().resolve()
+    return _load_semi_cached(str(path), tuple(_semi_mtimes(path)))
+
+
+def _semi_mtimes(path, seen=None):
+    if seen is None:
+        seen = set()
+    if path in seen:
+        return
+    seen.add(path)
+    yield (str(path), path.stat().st_mtime_ns)
+    with path.open(encoding='utf-8') as f:
+        for line in f:
+            match = re.match(r'\s*include:\s*(?P<filename>.+)$', line)
+            if match is not None:
+                include = path.parent.joinpath(
+                    match.group('filename').rstrip()).resolve()
+                yield from _semi_mtimes(include, seen)
+
+
+@lru_cache(maxsize=8)
+def _load_semi_cached(path, mtimes):
+    # lets ignore the SEM-I warnings until questions regarding
+    # valid SEM-Is are resolved
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return load_semi(path)
+
+
+@lru_cache(maxsize=None)
+def _get_header_joiner_footer(target_codec, lines, indented):
+    if lines:
+        header = footer = ''
+        joiner = '\n'
+    else:
+        header = getattr(target_codec, 'HEADER', '')
+        joiner = getattr(target_codec, 'JOINER', ' ')
+        footer = getattr(target_codec, 'FOOTER', '')
+        if indented:
+            if header:
+                header += '\n'
+            joiner = joiner.strip() + '\n'
+            if footer:
+                footer = '\n' + footer
+    return header, joiner, footer
+
+
 def _read(path, source_codec, select, kwargs):
+    # items are yielded as they are decoded so they need not all be in
+    # memory at once
     if hasattr(path, 'read'):
-        xs = list(source_codec.load(path, **kwargs))
+        yield from source_codec.load(path, **kwargs)
     else:
         path = Path(path).expanduser()
         if path.is_dir():
             db = tsdb.Database(path)
             # ts = itsdb.TestSuite(path)
-            xs = [
-                next(iter(source_codec.loads(r[0], **kwargs)), None)
-                for r in tsql.select(select, db)
-            ]
+            loads = source_codec.loads
+            for row in tsql.select(select, db):
+                s = row[0]
+                if not s or s.isspace():
+                    yield None  # empty values are skipped
+                else:
+                    yield next(iter(loads(s, **kwargs)), None)
         else:
-            xs = list(source_codec.load(path, **kwargs))
-    yield from xs
+            yield from source_codec.load(path, **kwargs)
 
 
 def _read_lines(path, source_codec, kwargs):
@@ -259,17 +354,40 @@ def _read_file(fh, source_codec, kwargs):
 def _iter_convert(converter, xs):
     if not converter:
         logger.info('no conversion necessary')
-        for i, x in enumerate(xs, 1):
-            logger.debug('item %d: %r', i, x)
-            yield x
     else:
         logger.info('converting...')
-        for i, x in enumerate(xs, 1):
-            logger.debug('item %d: %r', i, x)
+    for i, x in enumerate(xs, 1):
+        logger.debug('item %d: %r', i, x)
+        if x is None:
+            # e.g., an empty value in a testsuite; skip it here so the
+            # converter and encoder only ever see representations
+            logger.error('no representation for item %d', i)
+        elif not converter:
+            yield x
+        else:
             try:
-                yield converter(x)
+                x = converter(x)
             except PyDelphinException:
                 logger.error('could not convert item %d', i)
+            else:
+                yield x
+
+
+def _iter_encode(xs, target_codec, kwargs, header, joiner, footer):
+    yield header
+    first = True
+    for x in xs:
+        try:
+            s = target_codec.encode(x, **kwargs)
+        except (PyDelphinException, KeyError, IndexError):
+            logger.exception('could not convert representation')
+        else:
+            if first:
+                first = False
+            else:
+                yield joiner
+            yield s
+    yield footer
 
 
 ###############################################################################
@@ -343,6 +461,7 @@ def mkprof(destination, source=None, schema=None, where=None, delimiter=None,
     if schema is not None:
         schema = tsdb.read_schema(schema)
     old_relation_files = []
+    empty_tables = None  # None if not known which tables are empty
 
     # work in-place on destination test suite
     if source is None and refresh:
@@ -352,27 +471,29 @@ def mkprof(destination, source=None, schema=None, where=None, delimiter=None,
 
     # input is sentences on stdin or a file of sentences
     elif source is None and not refresh:
-        _mkprof_from_lines(
+        empty_tables = _mkprof_from_lines(
             destination, sys.stdin, schema, delimiter, gzip)
     elif source.is_file():
         with source.open() as fh:
-            _mkprof_from_lines(
+            empty_tables = _mkprof_from_lines(
                 destination, fh, schema, delimiter, gzip)
 
     # input is source testsuite
     elif source.is_dir():
         db = tsdb.Database(source)
         old_relation_files = list(db.schema)
-        _mkprof_from_database(
+        empty_tables = _mkprof_from_database(
             destination, db, schema, where, full, gzip)
 
     else:
         raise CommandError(f'invalid source for mkprof: {source!s}')
 
-    _mkprof_cleanup(destination, skeleton, old_relation_files)
+    schema = tsdb.read_schema(destination)
+    _mkprof_cleanup(
+        destination, schema, skeleton, old_relation_files, empty_tables)
 
     if not quiet:
-        _mkprof_summarize(destination, tsdb.read_schema(destination))
+        _mkprof_summarize(destination, schema)
 
 
 def _mkprof_from_lines(destination, stream, schema, delimiter, gzip):
@@ -385,16 +506,29 @@ def _mkprof_from_lines(destination, stream, schema, delimiter, gzip):
 
     # setup destination testsuite
     tsdb.initialize_database(destination, schema, files=True)
+    empty_tables = set(schema).difference(['item'])
+
+    records = _lines_to_records(lineiter, colnames, split, schema['item'])
+    first = next(records, None)
+    if first is None:
+        empty_tables.add('item')
+    else:
+        records = chain([first], records)
 
     tsdb.write(destination,
                'item',
-               _lines_to_records(lineiter, colnames, split, schema['item']),
+               records,
                fields=schema['item'],
                gzip=gzip)
 
+    return empty_tables
+
 
 def _lines_to_records(lineiter, colnames, split, fields):
 
+    # resolve field names once instead of for every record
+    names = [field.name for field in fields]
+
     with_i_id = with_i_length = False
     for field in fields:
         if field.name == 'i-id':
@@ -402,6 +536,9 @@ def _lines_to_records(lineiter, colnames, split, fields):
         elif field.name == 'i-length':
             with_i_length = True
 
+    # i-ids generated from line numbers are unique, so only those
+    # from the input are checked for duplicates
+    check_i_ids = with_i_id and 'i-id' in colnames
     i_ids = set()
     for i, line in enumerate(lineiter, 1):
         colvals = split(line.rstrip('\n'))
@@ -412,17 +549,19 @@ def _lines_to_records(lineiter, colnames, split, fields):
                 f'  values: {", ".join(colvals)}')
         colmap = dict(zip(colnames, colvals))
 
-        if with_i_id:
-            if 'i-id' not in colmap:
-                colmap['i-id'] = i
-            if colmap['i-id'] in i_ids:
-                raise CommandError(f'duplicate i-id: {colmap["i-id"]}')
-            i_ids.add(colmap['i-id'])
+        if check_i_ids:
+            i_id = colmap['i-id']
+            if i_id in i_ids:
+                raise CommandError(f'duplicate i-id: {i_id}')
+            i_ids.add(i_id)
+        elif with_i_id:
+            colmap['i-id'] = i
 
         if with_i_length and 'i-length' not in colmap and 'i-input' in colmap:
             colmap['i-length'] = len(colmap['i-input'].split())
 
-        yield tsdb.make_record(colmap, fields)
+        # same as tsdb.make_record(colmap, fields)
+        yield tuple(map(colmap.get, names))
 
 
 def _make_split(delimiter, lineiter):
@@ -439,8 +578,9 @@ def _make_split(delimiter, lineiter):
             split = tsdb.split
         else:
 
-            def split(line):
-                return line.split(delimiter)
+            # bind the delimiter as a default for fast local lookup
+            def split(line, _delimiter=delimiter):
+                return line.split(_delimiter)
 
         colnames = split(next(lineiter))
 
@@ -456,6 +596,7 @@ def _mkprof_from_database(destination, db, schema, where, full, gzip):
 
     to_copy = set(schema if full else tsdb.TSDB_CORE_FILES)
     where = '' if where is None else 'where ' + where
+    empty_tables = set()
 
     for table in schema:
         if table not in to_copy or _no_such_relation(db, table):
@@ -470,12 +611,16 @@ def _mkprof_from_database(destination, db, schema, where, full, gzip):
                 records = list(db[table])
         else:
             records = list(db[table])
+        if not records:
+            empty_tables.add(table)
         tsdb.write(destination,
                    table,
                    records,
                    schema[table],
                    gzip=gzip)
 
+    return empty_tables
+
 
 def _no_such_relation(db, name):
     """
@@ -501,22 +646,27 @@ def _tsql_distinct(records):
     return distinct
 
 
-def _mkprof_cleanup(destination, skeleton, old_files):
-    schema = tsdb.read_schema(destination)
+def _mkprof_cleanup(destination, schema, skeleton, old_files, empty_tables):
     to_keep = set(schema)
     if skeleton:
         to_keep = to_keep.intersection(tsdb.TSDB_CORE_FILES)
+    files = _scan_files(destination)
     for name in set(schema).union(old_files):
-        tx_path = destination.joinpath(name).with_suffix('')
-        gz_path = destination.joinpath(name).with_suffix('.gz')
-        if (tx_path.is_file()
-            and (name not in to_keep
-                 or (skeleton and tx_path.stat().st_size == 0))):
-            tx_path.unlink()
-        if (gz_path.is_file()
-            and (name not in to_keep
-                 or (skeleton and gz_path.stat().st_size == 0))):
-            gz_path.unlink()
+        for filename in (name, name + '.gz'):
+            entry = files.get(filename)
+            if entry is None:
+                continue
+            if name not in to_keep:
+                os.unlink(entry.path)
+            elif skeleton:
+                # only check the file size if it's not known whether
+                # the table was written empty
+                if empty_tables is None:
+                    is_empty = entry.stat().st_size == 0
+                else:
+                    is_empty = name in empty_tables
+                if is_empty:
+                    os.unlink(entry.path)
 
 
 def _mkprof_summarize(destination, schema):
@@ -527,16 +677,28 @@ def _mkprof_summarize(destination, schema):
         return f'\x1b[1;31m{s}\x1b[0m' if isatty else s
 
     fmt = '{:>8} bytes\t{}'
+    files = _scan_files(destination)
     for filename in ['relations'] + list(schema):
-        path = destination.joinpath(filename)
-        if path.is_file():
-            stat = path.stat()
+        if filename in files:
+            stat = files[filename].stat()
             print(fmt.format(stat.st_size, filename))
-        elif path.with_suffix('.gz').is_file():
-            stat = path.with_suffix('.gz').stat()
+        elif filename + '.gz' in files:
+            stat = files[filename + '.gz'].stat()
             print(fmt.format(stat.st_size, _red(filename + '.gz')))
 
 
+def _scan_files(directory):
+    """
+    Return a mapping of filenames to :class:`os.DirEntry` objects for
+    the regular files in *directory*.
+
+    This lists the directory once instead of checking each possible
+    file path separately.
+    """
+    with os.scandir(directory) as it:
+        return {entry.name: entry for entry in it if entry.is_file()}
+
+
 ###############################################################################
 # PROCESS #####################################################################
 
@@ -654,7 +816,7 @@ def process(grammar, testsuite, source=None, select=None,
 
 def _interpret_selection(select, source):
     schema = tsdb.read_schema(source)
-    queryobj = tsql.inspect_query('select ' + select)
+    queryobj = _inspect_select(select)
     projection = queryobj['projection']
     if projection == '*' or len(projection) != 1:
         raise CommandError("select query must return a single column")
@@ -678,10 +840,9 @@ def _interpret_selection(select, source):
     elif not any(f.name == column for f in schema[relation]):
         raise CommandError(f'invalid column in query: {column}')
 
-    try:
-        condition = select[select.index(' where ') + 7:]
-    except ValueError:
-        condition = ''
+    condition = ''
+    if queryobj['condition'] is not None:
+        condition = select.partition(' where ')[2]
     return column, relation, condition
 
 
@@ -690,7 +851,7 @@ def _interpret_selection(select, source):
 
 
 def repp(source, config=None, module=None, active=None,
-         format=None, color=False, trace_level=0):
+         format=None, color=False, trace_level=0, processes=1):
     """
     Tokenize with a Regular Expression PreProcessor (REPP).
 
@@ -715,6 +876,9 @@ def repp(source, config=None, module=None, active=None,
             applied rules are printed, if greater than `1`, both
             applied and unapplied rules (in order) are printed
             (default: `0`)
+        processes (int): number of worker processes used to tokenize
+            inputs; if `None`, use the number of CPUs; ignored if
+            *trace_level* is greater than `0` (default: `1`)
     """
     from delphin.repp import REPP, REPPResult
 
@@ -734,6 +898,9 @@ def repp(source, config=None, module=None, active=None,
     else:
         r = REPP()  # just tokenize
 
+    if processes is None:
+        processes = os.cpu_count() or 1
+
     def _repp(line):
         line = line.rstrip('\n')
         if trace_level > 0:
@@ -746,34 +913,70 @@ def repp(source, config=None, module=None, active=None,
                         print(highlight(f'-{step.input}\n+{step.output}'))
                     elif trace_level > 1:
                         print('Did not apply:', step.operation)
+            return r.tokenize_result(step)
+        return _repp_tokenize(r, line)
+
+    def _run(lines):
+        if trace_level > 0 or processes <= 1:
+            for line in lines:
+                _print_tokens(_repp(line), format)
         else:
-            step = r.apply(line)
-        res = r.tokenize_result(step)
-        if format == 'yy':
-            print(res)
-        elif format == 'string':
-            print(' '.join(t.form for t in res.tokens))
-        elif format == 'line':
-            for t in res.tokens:
-                print(t.form)
-            print()
-        elif format == 'triple':
-            for t in res.tokens:
-                if t.lnk.type == Lnk.CHARSPAN:
-                    cfrom, cto = t.lnk.data
-                else:
-                    cfrom, cto = -1, -1
-                print(f'({cfrom}, {cto}, {t.form})')
-            print()
+            # each line is tokenized independently, so lines can be
+            # farmed out to worker processes in order-preserving chunks
+            import multiprocessing
+            with multiprocessing.Pool(processes,
+                                      initializer=_init_repp_worker,
+                                      initargs=(r,)) as pool:
+                for res in pool.imap(_repp_worker, lines, chunksize=256):
+                    _print_tokens(res, format)
 
     if hasattr(source, 'read'):
-        for line in source:
-            _repp(line)
+        _run(source)
     else:
         source = Path(source).expanduser()
         with source.open(encoding='utf-8') as fh:
-            for line in fh:
-                _repp(line)
+            _run(fh)
+
+
+def _print_tokens(res, format):
+    # build each input's output as one string to write it at once
+    if format == 'yy':
+        out = f'{res}\n'
+    elif format == 'string':
+        out = ' '.join(t.form for t in res.tokens) + '\n'
+    elif format == 'line':
+        out = ''.join(f'{t.form}\n' for t in res.tokens) + '\n'
+    elif format == 'triple':
+        lines = []
+        for t in res.tokens:
+            if t.lnk.type == Lnk.CHARSPAN:
+                cfrom, cto = t.lnk.data
+            else:
+                cfrom, cto = -1, -1
+            lines.append(f'({cfrom}, {cto}, {t.form})\n')
+        out = ''.join(lines) + '\n'
+    else:
+        return
+    sys.stdout.write(out)
+
+
+# REPP object used by worker processes of repp()
+_worker_repp = None
+
+
+def _init_repp_worker(r):
+    global _worker_repp
+    _worker_repp = r
+
+
+def _repp_worker(line):
+    return _repp_tokenize(_worker_repp, line)
+
+
+def _repp_tokenize(r, line):
+    # shared by the serial and parallel paths so both use the default
+    # tokenization pattern on the rewritten string
+    return r.tokenize_result(r.apply(line.rstrip('\n')))
 
 
 ###############################################################################
@@ -809,36 +1012,58 @@ def compare(testsuite: Union[util.PathLike, itsdb.TestSuite],
     if not isinstance(gold, itsdb.TestSuite):
         gold = itsdb.TestSuite(_validate_tsdb(gold))
 
-    queryobj = tsql.inspect_query('select ' + select)
+    queryobj = _inspect_select(select)
     if len(queryobj['projection']) != 3:
         raise CommandError('select does not return 3 fields: ' + select)
 
     input_select = '{} {}'.format(queryobj['projection'][0],
                                   queryobj['projection'][1])
+    # the id -> input mapping is only needed for items without test
+    # results, so it is built on first use
+    i_inputs: Optional[Dict] = None
+
     # typing of tsql.select() is complicated right now, so just ignore
     # it for the following calls. it may be easier after
     # https://github.com/delph-in/pydelphin/issues/258
-    i_inputs = dict(tsql.select(input_select, testsuite))  # type: ignore
-
     matched_rows = itsdb.match_rows(
         tsql.select(select, testsuite),  # type: ignore
         tsql.select(select, gold),       # type: ignore
         0)
 
+    # identical MRS strings (e.g., repeated results) are only decoded
+    # once; the cache is local so decoded MRSs don't outlive the call
+    decode = lru_cache(maxsize=4096)(simplemrs.decode)
+
     for (key, testrows, goldrows) in matched_rows:
         (test_unique, shared, gold_unique) = mrs.compare_bags(
-            [simplemrs.decode(row[2]) for row in testrows],
-            [simplemrs.decode(row[2]) for row in goldrows])
+            [decode(row[2]) for row in testrows],
+            [decode(row[2]) for row in goldrows])
+        if testrows:
+            i_input = testrows[0][1]
+        else:
+            if i_inputs is None:
+                i_inputs = dict(
+                    tsql.select(input_select, testsuite))  # type: ignore
+            i_input = i_inputs.get(key)
         yield {'id': key,
-               'input': i_inputs.get(key),
+               'input': i_input,
                'test': test_unique,
                'shared': shared,
                'gold': gold_unique}
 
+    logger.debug('MRS decoding cache: %s', decode.cache_info())
+
 
 ###############################################################################
 # HELPERS #####################################################################
 
+@lru_cache(maxsize=256)
+def _inspect_select(select):
+    # The parsed query is shared by all callers with the same query,
+    # so it must not be modified.
+    return tsql.inspect_query('select ' + select)
+
+
 def _validate_tsdb(path):
     path = Path(path).expanduser()
     if not tsdb.is_database_directory(path):
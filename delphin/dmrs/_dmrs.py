@@ -203,8 +203,8 @@ class DMRS(scope.ScopingSemanticStructure):
             return NotImplemented
         return (self.top == other.top
                 and self.index == other.index
-                and self.nodes == other.nodes
-                and self.links == other.links)
+                and self.links == other.links
+                and self.nodes == other.nodes)
 
     # SemanticStructure methods
 
@@ -218,6 +218,16 @@ class DMRS(scope.ScopingSemanticStructure):
         return any(link.role == RESTRICTION_ROLE
                    for link in self.links if link.start == id)
 
+    def quantifier_ids(self):
+        """
+        Return the set of ids of quantifier nodes.
+
+        This finds all quantifiers in one pass over the links, whereas
+        :meth:`is_quantifier` scans the links for each call.
+        """
+        return {link.start for link in self.links
+                if link.role == RESTRICTION_ROLE}
+
     def quantification_pairs(self):
         qs = set()
         qmap = {}
@@ -293,21 +303,27 @@ class DMRS(scope.ScopingSemanticStructure):
         """
 
         h = variable.HANDLE
-        vfac = variable.VariableFactory(starting_vid=1)
 
-        id_to_lbl = {node.id: vfac.new(h) for node in self.nodes}
+        # each node gets a fresh label, numbered from 1, as a
+        # VariableFactory would produce but without its bookkeeping
+        id_to_lbl = {}
+        prescopes = {}
+        for i, node in enumerate(self.nodes, 1):
+            lbl = f'{h}{i}'
+            id_to_lbl[node.id] = lbl
+            prescopes[lbl] = [node]
 
         leqs = [(id_to_lbl[link.start], id_to_lbl[link.end])
                 for link in self.links
                 if link.post == EQ_POST]
-        prescopes = {id_to_lbl[node.id]: [node] for node in self.nodes}
 
         scopes = scope.conjoin(prescopes, leqs)
         top = None
         if self.top is not None:
-            top_node = self[self.top]
+            # compare ids as nodes with different ids may be equal
+            top_id = self.top
             top = next((label for label, nodes in scopes.items()
-                        if top_node in nodes),
+                        if any(node.id == top_id for node in nodes)),
                        None)
 
         return top, scopes
@@ -339,13 +355,12 @@ class DMRS(scope.ScopingSemanticStructure):
                 for node in nodes:
                     id_to_lbl[node.id] = label
 
+        # map scopal posts to relations; other links are skipped
+        relations = {HEQ_POST: scope.LHEQ, H_POST: scope.QEQ}
         scargs = {node.id: [] for node in self.nodes}
         for link in self.links:
-            if link.post == HEQ_POST:
-                relation = scope.LHEQ
-            elif link.post == H_POST:
-                relation = scope.QEQ
-            else:
+            relation = relations.get(link.post)
+            if relation is None:
                 continue
             # get the label if scopes was given
             target = id_to_lbl.get(link.end, link.end)
@@ -69,7 +69,8 @@ def _mrs_to_nodes(m, id_to_nid):
         properties, type = None, None
         if not ep.is_quantifier():
             iv = ep.iv
-            properties = m.properties(iv)
+            # the EP's properties are those of its intrinsic variable
+            properties = m.variables[iv]
             type = variable.type(iv)
         nodes.append(
             dmrs.Node(node_id,
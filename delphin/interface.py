@@ -5,7 +5,10 @@ Interfaces for external data providers.
 """
 
 from typing import Optional
-from collections import Sequence
+from collections.abc import Sequence
+import sys
+import re
+import reprlib
 
 from delphin import util
 from delphin import exceptions
@@ -13,6 +16,59 @@ from delphin import exceptions
 from delphin.__about__ import __version__  # noqa: F401
 
 
+# JSON objects start with a quoted key (or are empty), which
+# distinguishes them from native EDS strings that start with '{e2:'
+_json_object_re = re.compile(r'\s*\{\s*["}]')
+
+class _ResponseRepr(reprlib.Repr):
+    """
+    Abbreviate long strings anywhere in a response's repr.
+
+    Unlike :class:`reprlib.Repr`, dictionary keys keep their order and
+    no keys or list items are dropped. As with the builtin repr,
+    containers that contain themselves are shown as ``{...}`` or
+    ``[...]``; nesting deeper than :attr:`maxlevel` is cut off the
+    same way.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.maxstring = 128
+        self.maxlist = self.maxtuple = sys.maxsize
+        self._active = set()  # ids of containers being repr'd
+
+    def repr1(self, x, level):
+        # dict and list subclasses (e.g., Result) are shown as such
+        if isinstance(x, dict):
+            return self._guard(self.repr_dict, x, level, '{...}')
+        elif isinstance(x, list):
+            return self._guard(self.repr_list, x, level, '[...]')
+        return super().repr1(x, level)
+
+    def _guard(self, func, x, level, placeholder):
+        key = id(x)
+        if key in self._active:
+            return placeholder
+        self._active.add(key)
+        try:
+            return func(x, level)
+        finally:
+            self._active.discard(key)
+
+    def repr_dict(self, x, level):
+        if not x:
+            return '{}'
+        if level <= 0:
+            return '{' + self.fillvalue + '}'
+        repr1 = self.repr1
+        return '{' + ', '.join(
+            '{}: {}'.format(repr1(key, level - 1), repr1(val, level - 1))
+            for key, val in x.items()) + '}'
+
+
+_repr = _ResponseRepr()
+
+
 class InterfaceError(exceptions.PyDelphinException):
     """Raised on invalid interface operations."""
 
@@ -56,15 +112,46 @@ class Processor(object):
         raise NotImplementedError()
 
 
-class Result(dict):
+class _DecodingDict(dict):
+    """
+    Base class for dictionaries that cache objects decoded from their
+    values.
+    """
+
+    __slots__ = ('_decoded',)
+
+    def _decode(self, key, raw, decoder):
+        """
+        Return *raw* decoded by *decoder*, reusing the object cached
+        under *key* if *raw* has not changed since it was decoded.
+        """
+        try:
+            cache = self._decoded
+        except AttributeError:
+            cache = self._decoded = {}
+        cached = cache.get(key)
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        obj = decoder(raw)
+        cache[key] = (raw, obj)
+        return obj
+
+
+class Result(_DecodingDict):
     """
     A wrapper around a result dictionary to automate deserialization
     for supported formats. A Result is still a dictionary, so the
     raw data can be obtained using dict access.
+
+    Deserialized objects are cached, so repeated calls to, e.g.,
+    :meth:`mrs` return the same object until the raw value is
+    replaced.
     """
 
+    __slots__ = ()
+
     def __repr__(self):
-        return 'Result({})'.format(dict.__repr__(self))
+        return 'Result({})'.format(_repr.repr(self))
 
     def derivation(self):
         """
@@ -81,17 +168,9 @@ class Result(dict):
                 :mod:`delphin.derivation` is unavailable
         """
         drv = self.get('derivation')
-        try:
-            from delphin import derivation
-            if isinstance(drv, dict):
-                drv = derivation.from_dict(drv)
-            elif isinstance(drv, str):
-                drv = derivation.from_string(drv)
-            elif drv is not None:
-                raise TypeError(drv.__class__.__name__)
-        except (ImportError, TypeError) as exc:
-            raise InterfaceError('can not get Derivation object') from exc
-        return drv
+        if drv is None:
+            return None
+        return self._decode('derivation', drv, _decode_derivation)
 
     def tree(self):
         """
@@ -103,22 +182,12 @@ class Result(dict):
         tree = self.get('tree')
 
         if isinstance(tree, str):
-            tree = util.SExpr.parse(tree).data
+            tree = self._decode('tree', tree, _parse_tree)
 
         elif tree is None:
             drv = self.get('derivation')
             if isinstance(drv, dict) and 'label' in drv:
-
-                def _extract_tree(d):
-                    t = [d.get('label', '')]
-                    if 'tokens' in d:
-                        t.append([d.get('form', '')])
-                    else:
-                        for dtr in d.get('daughters', []):
-                            t.append(_extract_tree(dtr))
-                    return t
-
-                tree = _extract_tree(drv)
+                tree = self._decode('tree', drv, _extract_tree)
 
         return tree
 
@@ -129,7 +198,8 @@ class Result(dict):
         If :mod:`delphin.codecs.simplemrs` is available and the value
         of the `mrs` key in the result is a valid SimpleMRS string, or
         if :mod:`delphin.codecs.mrsjson` is available and the value is
-        a dictionary, return the interpreted MRS object. If there is
+        a dictionary or a JSON string, return the interpreted MRS
+        object. If there is
         no `mrs` key in the result, return `None`.
 
         Raises:
@@ -137,18 +207,9 @@ class Result(dict):
                 the corresponding module is unavailable
         """
         mrs = self.get('mrs')
-        try:
-            if isinstance(mrs, dict):
-                from delphin.codecs import mrsjson
-                mrs = mrsjson.from_dict(mrs)
-            elif isinstance(mrs, str):
-                from delphin.codecs import simplemrs
-                mrs = simplemrs.decode(mrs)
-            elif mrs is not None:
-                raise TypeError(mrs.__class__.__name__)
-        except (ImportError, TypeError) as exc:
-            raise InterfaceError('can not get MRS object') from exc
-        return mrs
+        if mrs is None:
+            return None
+        return self._decode('mrs', mrs, _decode_mrs)
 
     def eds(self):
         """
@@ -157,7 +218,8 @@ class Result(dict):
         If :mod:`delphin.codecs.eds` is available and the value of the
         `eds` key in the result is a valid "native" EDS serialization,
         or if :mod:`delphin.codecs.edsjson` is available and the value
-        is a dictionary, return the interpreted EDS object. If there
+        is a dictionary or a JSON string, return the interpreted EDS
+        object. If there
         is no `eds` key in the result, return `None`.
 
         Raises:
@@ -165,61 +227,145 @@ class Result(dict):
                 the corresponding module is unavailable
         """
         eds = self.get('eds')
-        try:
-            if isinstance(eds, dict):
-                from delphin.codecs import edsjson
-                eds = edsjson.from_dict(eds)
-            elif isinstance(eds, str):
-                from delphin.codecs import eds as edsnative
-                eds = edsnative.decode(eds)
-            elif eds is not None:
-                raise TypeError(eds.__class__.__name__)
-        except (ImportError, TypeError) as exc:
-            raise InterfaceError('can not get EDS object') from exc
-        return eds
+        if eds is None:
+            return None
+        return self._decode('eds', eds, _decode_eds)
 
     def dmrs(self):
         """
         Interpret and return a Dmrs object.
 
         If :mod:`delphin.codecs.dmrsjson` is available and the value
-        of the `dmrs` key in the result is a dictionary, return the
-        interpreted DMRS object. If there is no `dmrs` key in the
-        result, return `None`.
+        of the `dmrs` key in the result is a dictionary or a JSON
+        string, return the interpreted DMRS object. If there is no
+        `dmrs` key in the result, return `None`.
 
         Raises:
-            InterfaceError: when the value is not a dictionary or
-                :mod:`delphin.codecs.dmrsjson` is unavailable
+            InterfaceError: when the value is not a dictionary or JSON
+                string, or :mod:`delphin.codecs.dmrsjson` is
+                unavailable
         """
         dmrs = self.get('dmrs')
-        try:
-            if isinstance(dmrs, dict):
-                from delphin.codecs import dmrsjson
-                dmrs = dmrsjson.from_dict(dmrs)
-            elif dmrs is not None:
-                raise TypeError(dmrs.__class__.__name__)
-        except (ImportError, TypeError) as exc:
-            raise InterfaceError('can not get DMRS object') from exc
-        return dmrs
-
-
-class Response(dict):
+        if dmrs is None:
+            return None
+        return self._decode('dmrs', dmrs, _decode_dmrs)
+
+
+def _decode_derivation(drv):
+    try:
+        from delphin import derivation
+        if isinstance(drv, dict):
+            drv = derivation.from_dict(drv)
+        elif isinstance(drv, str):
+            drv = derivation.from_string(drv)
+        else:
+            raise TypeError(drv.__class__.__name__)
+    except (ImportError, TypeError) as exc:
+        raise InterfaceError('can not get Derivation object') from exc
+    return drv
+
+
+def _parse_tree(tree):
+    return util.SExpr.parse(tree).data
+
+
+def _extract_tree(drv):
+    # walk the derivation with an explicit agenda so deep derivations
+    # do not hit the recursion limit
+    root = []
+    agenda = [(drv, root)]
+    while agenda:
+        d, parent = agenda.pop()
+        t = [d.get('label', '')]
+        parent.append(t)
+        if 'tokens' in d:
+            t.append([d.get('form', '')])
+        else:
+            # reversed so daughters are popped, and appended, in order
+            agenda.extend((dtr, t) for dtr in reversed(d.get('daughters', [])))
+    return root[0]
+
+
+def _decode_mrs(mrs):
+    try:
+        if isinstance(mrs, dict):
+            from delphin.codecs import mrsjson
+            mrs = mrsjson.from_dict(mrs)
+        elif isinstance(mrs, str) and _json_object_re.match(mrs):
+            from delphin.codecs import mrsjson
+            mrs = mrsjson.decode(mrs)
+        elif isinstance(mrs, str):
+            from delphin.codecs import simplemrs
+            mrs = simplemrs.decode(mrs)
+        else:
+            raise TypeError(mrs.__class__.__name__)
+    except (ImportError, TypeError) as exc:
+        raise InterfaceError('can not get MRS object') from exc
+    return mrs
+
+
+def _decode_eds(eds):
+    try:
+        if isinstance(eds, dict):
+            from delphin.codecs import edsjson
+            eds = edsjson.from_dict(eds)
+        elif isinstance(eds, str) and _json_object_re.match(eds):
+            from delphin.codecs import edsjson
+            eds = edsjson.decode(eds)
+        elif isinstance(eds, str):
+            from delphin.codecs import eds as edsnative
+            eds = edsnative.decode(eds)
+        else:
+            raise TypeError(eds.__class__.__name__)
+    except (ImportError, TypeError) as exc:
+        raise InterfaceError('can not get EDS object') from exc
+    return eds
+
+
+def _decode_dmrs(dmrs):
+    try:
+        if isinstance(dmrs, dict):
+            from delphin.codecs import dmrsjson
+            dmrs = dmrsjson.from_dict(dmrs)
+        elif isinstance(dmrs, str) and _json_object_re.match(dmrs):
+            from delphin.codecs import dmrsjson
+            dmrs = dmrsjson.decode(dmrs)
+        else:
+            raise TypeError(dmrs.__class__.__name__)
+    except (ImportError, TypeError) as exc:
+        raise InterfaceError('can not get DMRS object') from exc
+    return dmrs
+
+
+class Response(_DecodingDict):
     """
     A wrapper around the response dictionary for more convenient
     access to results.
+
+    Token lattices are cached, so repeated calls to :meth:`tokens`
+    return the same object until the raw value is replaced.
     """
+
+    __slots__ = ()
+
     _result_cls = Result
 
     def __repr__(self):
-        return 'Response({})'.format(dict.__repr__(self))
+        return 'Response({})'.format(_repr.repr(self))
 
     def results(self):
         """Return Result objects for each result."""
-        return [self._result_cls(r) for r in self.get('results', [])]
+        return [self._result_cls(r) for r in self.get('results', ())]
+
+    def iter_results(self):
+        """Yield a Result object for each result."""
+        result_cls = self._result_cls
+        for r in self.get('results', ()):
+            yield result_cls(r)
 
     def result(self, i):
         """Return a Result object for the result *i*."""
-        return self._result_cls(self.get('results', [])[i])
+        return self._result_cls(self.get('results', ())[i])
 
     def tokens(self, tokenset='internal'):
         """
@@ -239,15 +385,22 @@ class Response(dict):
             InterfaceError: when the value is an unsupported type or
                 :mod:`delphin.tokens` is unavailble
         """
-        toks = self.get('tokens', {}).get(tokenset)
-        try:
-            from delphin import tokens
-            if isinstance(toks, str):
-                toks = tokens.YYTokenLattice.from_string(toks)
-            elif isinstance(toks, Sequence):
-                toks = tokens.YYTokenLattice.from_list(toks)
-            elif toks is not None:
-                raise TypeError(toks.__class__.__name__)
-        except (KeyError, ImportError, TypeError) as exc:
-            raise InterfaceError('can not get YYTokenLattice object') from exc
-        return toks
+        tokensets = self.get('tokens')
+        toks = tokensets.get(tokenset) if tokensets else None
+        if toks is None:
+            return None
+        return self._decode(tokenset, toks, _decode_tokens)
+
+
+def _decode_tokens(toks):
+    try:
+        from delphin import tokens
+        if isinstance(toks, str):
+            toks = tokens.YYTokenLattice.from_string(toks)
+        elif isinstance(toks, Sequence):
+            toks = tokens.YYTokenLattice.from_list(toks)
+        else:
+            raise TypeError(toks.__class__.__name__)
+    except (KeyError, ImportError, TypeError) as exc:
+        raise InterfaceError('can not get YYTokenLattice object') from exc
+    return toks
@@ -34,6 +34,28 @@ _default_task_selectors = {
     'generate': ('result', 'mrs'),
 }
 
+# the parse keys exclude some that are handled specially
+_parse_keys = tuple('''
+    ninputs ntokens readings first total tcpu tgc treal words
+    l-stasks p-ctasks p-ftasks p-etasks p-stasks
+    aedges pedges raedges rpedges tedges eedges ledges sedges redges
+    unifications copies conses symbols others gcs i-load a-load
+    date error comment
+'''.split())
+_result_keys = tuple('''
+    result-id time r-ctasks r-ftasks r-etasks r-stasks size
+    r-aedges r-pedges derivation surface tree mrs
+'''.split())
+_run_keys = tuple('''
+    run-comment platform protocol tsdb application environment
+    grammar avms sorts templates lexicon lrules rules
+    user host os start end items status
+'''.split())
+_affected_tables = tuple('''
+    run parse result rule output edge tree decision preference
+    update fold score
+'''.split())
+
 
 #############################################################################
 # Exceptions
@@ -84,31 +106,16 @@ class FieldMapper(object):
             processing
     """
     def __init__(self):
-        # the parse keys exclude some that are handled specially
-        self._parse_keys = '''
-            ninputs ntokens readings first total tcpu tgc treal words
-            l-stasks p-ctasks p-ftasks p-etasks p-stasks
-            aedges pedges raedges rpedges tedges eedges ledges sedges redges
-            unifications copies conses symbols others gcs i-load a-load
-            date error comment
-        '''.split()
-        self._result_keys = '''
-            result-id time r-ctasks r-ftasks r-etasks r-stasks size
-            r-aedges r-pedges derivation surface tree mrs
-        '''.split()
-        self._run_keys = '''
-            run-comment platform protocol tsdb application environment
-            grammar avms sorts templates lexicon lrules rules
-            user host os start end items status
-        '''.split()
+        self._parse_keys = _parse_keys
+        self._result_keys = _result_keys
+        self._run_keys = _run_keys
         self._parse_id = -1
         self._runs = {}
+        self._runs_in_order = True
+        self._max_run_id = -1
         self._last_run_id = -1
 
-        self.affected_tables = '''
-            run parse result rule output edge tree decision preference
-            update fold score
-        '''.split()
+        self.affected_tables = list(_affected_tables)
 
     def map(self, response: interface.Response) -> Transaction:
         """
@@ -121,22 +128,28 @@ class FieldMapper(object):
         assert isinstance(parse_id, int)
         transaction.append(('parse', patch))
 
-        result: interface.Result
-        for result in response.results():
+        # Result objects are created one at a time as they are mapped
+        for result in response.iter_results():
             patch = self._map_result(result, parse_id)
             transaction.append(('result', patch))
 
-        for edge in response.get('chart', []):
+        for edge in response.get('chart', ()):
             patch = self._map_edge(edge, parse_id)
             transaction.append(('edge', patch))
 
         if 'run' in response:
             run_id = response['run'].get('run-id', -1)
-            # check if last run was not closed properly
-            if run_id not in self._runs and self._last_run_id in self._runs:
-                last_run = self._runs[self._last_run_id]
-                if 'end' not in last_run:
-                    last_run['end'] = datetime.now()
+            if run_id not in self._runs:
+                # check if last run was not closed properly
+                if self._last_run_id in self._runs:
+                    last_run = self._runs[self._last_run_id]
+                    if 'end' not in last_run:
+                        last_run['end'] = datetime.now()
+                # runs only need sorting if an id arrives out of order
+                if self._runs and run_id < self._max_run_id:
+                    self._runs_in_order = False
+                else:
+                    self._max_run_id = run_id
             self._runs[run_id] = response['run']
             self._last_run_id = run_id
 
@@ -145,10 +158,14 @@ class FieldMapper(object):
     def _map_parse(self, response: interface.Response) -> tsdb.ColumnMap:
         patch: tsdb.ColumnMap = {}
         # custom remapping, cleanup, and filling in holes
-        patch['i-id'] = response.get('keys', {}).get('i-id', -1)
-        self._parse_id = max(self._parse_id + 1, patch['i-id'])
+        keys = response.get('keys')
+        patch['i-id'] = keys.get('i-id', -1) if keys else -1
+        i_id = patch['i-id']
+        parse_id = self._parse_id + 1
+        self._parse_id = parse_id if parse_id > i_id else i_id
         patch['parse-id'] = self._parse_id
-        patch['run-id'] = response.get('run', {}).get('run-id', -1)
+        run = response.get('run')
+        patch['run-id'] = run.get('run-id', -1) if run else -1
         if 'tokens' in response:
             patch['p-input'] = response['tokens'].get('initial')
             patch['p-tokens'] = response['tokens'].get('internal')
@@ -163,9 +180,9 @@ class FieldMapper(object):
         if 'readings' not in response and 'results' in response:
             response['readings'] = len(response['results'])
         # basic mapping
-        for key in self._parse_keys:
-            if key in response:
-                patch[key] = response[key]
+        # keys are copied in schema order so rows are built consistently
+        patch.update({key: response[key]
+                      for key in self._parse_keys if key in response})
         return patch
 
     def _map_result(self,
@@ -174,9 +191,8 @@ class FieldMapper(object):
         patch: tsdb.ColumnMap = {'parse-id': parse_id}
         if 'flags' in result:
             patch['flags'] = util.SExpr.format(result['flags'])
-        for key in self._result_keys:
-            if key in result:
-                patch[key] = result[key]
+        patch.update({key: result[key]
+                      for key in self._result_keys if key in result})
         return patch
 
     def _map_edge(self,
@@ -206,17 +222,20 @@ class FieldMapper(object):
             if 'end' not in last_run:
                 last_run['end'] = datetime.now()
 
-            for run_id in sorted(self._runs):
-                run = self._runs[run_id]
+            runs = self._runs
+            run_ids = runs if self._runs_in_order else sorted(runs)
+            for run_id in run_ids:
+                run = runs[run_id]
                 d = {'run-id': run.get('run-id', -1)}
-                for key in self._run_keys:
-                    if key in run:
-                        d[key] = run[key]
+                d.update({key: run[key]
+                          for key in self._run_keys if key in run})
                 inserts.append(('run', d))
 
         # reset for next task
         self._parse_id = -1
         self._runs = {}
+        self._runs_in_order = True
+        self._max_run_id = -1
         self._last_run_id = -1
 
         return inserts
@@ -844,18 +863,24 @@ class TestSuite(tsdb.Database):
             self[name].clear()
 
         key_names = [f.name for f in source.schema[input_table] if f.is_key]
+        input_index = index[input_column]
+        key_indices = [index[name] for name in key_names]
 
-        for row in source[input_table]:
-            datum = row[index[input_column]]
-            keys = [row[index[name]] for name in key_names]
-            keys_dict = dict(zip(key_names, keys))
-            response = cpu.process_item(datum, keys=keys_dict)
-            logger.info(
-                'Processed item {:>16}  {:>8} results'
-                .format(tsdb.join(keys), len(response['results']))
-            )
-            for tablename, data in fieldmapper.map(response):
-                _add_row(self, tablename, data, buffer_size)
+        table = source[input_table]
+        try:
+            for row in table:
+                datum = row[input_index]
+                keys = [row[i] for i in key_indices]
+                keys_dict = dict(zip(key_names, keys))
+                response = cpu.process_item(datum, keys=keys_dict)
+                logger.info(
+                    'Processed item {:>16}  {:>8} results'
+                    .format(tsdb.join(keys), len(response['results']))
+                )
+                for tablename, data in fieldmapper.map(response):
+                    _add_row(self, tablename, data, buffer_size)
+        finally:
+            table.close()
 
         for tablename, data in fieldmapper.cleanup():
             _add_row(self, tablename, data, buffer_size)
@@ -870,12 +895,9 @@ def _add_row(ts: TestSuite,
     """
     Prepare and append a Row into its Table; flush to disk if necessary.
     """
-    fields = ts.schema[name]
-    # remove any keys that aren't relation fields
-    for invalid_key in set(data).difference([f.name for f in fields]):
-        del data[invalid_key]
-
-    ts[name].append(tsdb.make_record(data, fields))
+    # make_record() only selects the relation's fields, so keys that
+    # aren't relation fields are ignored without removing them first
+    ts[name].append(tsdb.make_record(data, ts.schema[name]))
 
     num_changes = 0
     for _name in ts:
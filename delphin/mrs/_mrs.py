@@ -230,11 +230,10 @@ class MRS(scope.ScopingSemanticStructure):
                  surface=None,
                  identifier=None):
 
-        if rels is None:
-            rels = []
+        rels = list(rels) if rels is not None else []
         _uniquify_ids(rels)
 
-        super().__init__(top, index, list(rels), lnk, surface, identifier)
+        super().__init__(top, index, rels, lnk, surface, identifier)
 
         if hcons is None:
             hcons = []
@@ -255,11 +254,13 @@ class MRS(scope.ScopingSemanticStructure):
     def __eq__(self, other):
         if not isinstance(other, MRS):
             return NotImplemented
+        # constraints are tuples and compare in C, so check them before
+        # the predications, whose comparison is done in Python
         return (self.top == other.top
                 and self.index == other.index
-                and self.rels == other.rels
                 and self.hcons == other.hcons
                 and self.icons == other.icons
+                and self.rels == other.rels
                 and self.variables == other.variables)
 
     # SemanticStructure methods
@@ -280,14 +281,15 @@ class MRS(scope.ScopingSemanticStructure):
         return RESTRICTION_ROLE in self[id].args
 
     def quantification_pairs(self):
-        qmap = {ep.iv: ep
-                for ep in self.rels
-                if ep.is_quantifier()}
-        pairs = []
-        # first pair non-quantifiers to their quantifier, if any
+        qmap = {}
+        eps = []
         for ep in self.rels:
-            if not ep.is_quantifier():
-                pairs.append((ep, qmap.get(ep.iv)))
+            if ep.is_quantifier():
+                qmap[ep.iv] = ep
+            else:
+                eps.append(ep)
+        # first pair non-quantifiers to their quantifier, if any
+        pairs = [(ep, qmap.get(ep.iv)) for ep in eps]
         # then unpaired quantifiers, if any
         for _, q in pairs:
             # some bad MRSs have multiple EPs share an ARG0; avoid the
@@ -374,11 +376,14 @@ class MRS(scope.ScopingSemanticStructure):
 # Helper functions
 
 def _uniquify_ids(rels):
-    nextvid = max((variable.id(ep.iv) for ep in rels if ep.iv),
-                  default=0)
+    # the next free id is only computed once a duplicate is found
+    nextvid = None
     ids = set()
     for ep in rels:
         if ep.id in ids:
+            if nextvid is None:
+                nextvid = max((variable.id(p.iv) for p in rels if p.iv),
+                              default=0)
             ep.id = '_{}'.format(nextvid)
             nextvid += 1
         ids.add(ep.id)
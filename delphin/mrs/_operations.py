@@ -3,7 +3,8 @@
 Operations on MRS structures
 """
 
-from typing import Iterable, Dict, Set, Optional
+from typing import Iterable, Dict, List, Optional
+from itertools import chain
 
 from delphin import variable
 from delphin import predicate
@@ -22,22 +23,32 @@ def is_connected(m: mrs.MRS) -> bool:
     arguments (including qeqs), or label equalities.
     """
     ids = {ep.id for ep in m.rels}
-    g: Dict[Identifier, Set[Identifier]] = {id: set() for id in ids}
+    # adjacency lists are much smaller than sets and the traversal
+    # tolerates repeated neighbors, so edges are simply appended
+    g: Dict[Identifier, List[Identifier]] = {id: [] for id in ids}
     # first establish links from labels and intrinsic variables to EPs
     for ep in m.rels:
         id, lbl, iv = ep.id, ep.label, ep.iv
-        g[id].update((lbl, iv))
-        g.setdefault(lbl, set()).add(id)
+        g[id].append(lbl)
+        g.setdefault(lbl, []).append(id)
         if iv:
-            g.setdefault(iv, set()).add(id)
-    # arguments may link EPs with IVs or labels (or qeq) as targets
+            g[id].append(iv)
+            g.setdefault(iv, []).append(id)
+    # arguments may link EPs with IVs or labels (or qeq) as targets;
+    # they are read from the EPs directly rather than building the
+    # full structure with m.arguments()
     hcmap = {hc.hi: hc.lo for hc in m.hcons}
-    for id, roleargs in m.arguments().items():
-        for role, value in roleargs:
+    ARG0, CARG = mrs.INTRINSIC_ROLE, mrs.CONSTANT_ROLE
+    for ep in m.rels:
+        id = ep.id
+        edges = g[id]
+        for role, value in ep.args.items():
+            if role == ARG0 or role == CARG:
+                continue
             value = hcmap.get(value, value)  # resolve qeq if any
             if value in g:
-                g[id].add(value)
-                g[value].add(id)
+                edges.append(value)
+                g[value].append(id)
     return ids.issubset(util._bfs(g))
 
 
@@ -117,9 +128,18 @@ def plausibly_scopes(m: mrs.MRS) -> bool:
     if m.top not in hcmap:
         return False
     seen = set([m.top])
-    for id, roleargs in m.arguments(types='h').items():
-        for _, handle in roleargs:
-            if handle == m[id].label:
+    H = variable.HANDLE
+    ARG0, CARG = mrs.INTRINSIC_ROLE, mrs.CONSTANT_ROLE
+    vartype = variable.type
+    for ep in m.rels:
+        label = ep.label
+        for role, handle in ep.args.items():
+            # only outgoing scopal arguments
+            if (role == ARG0
+                    or role == CARG
+                    or vartype(handle) != H):
+                continue
+            if handle == label:
                 return False
             elif handle in hcmap:
                 if handle in seen:
@@ -169,10 +189,11 @@ def is_isomorphic(m1: mrs.MRS,
 
 
 def _make_mrs_isograph(x, properties):
-    g: Dict[Identifier, Dict[Optional[Identifier], str]] = {}
-    g.update((v, {}) for v in x.variables)
-    g.update((ep.id, {}) for ep in x.rels)
+    g: Dict[Identifier, Dict[Optional[Identifier], str]] = {
+        id: {} for id in chain(x.variables, (ep.id for ep in x.rels))}
 
+    CARG = mrs.CONSTANT_ROLE
+    normalize = predicate.normalize
     for ep in x.rels:
         # optimization: retrieve early to avoid successive lookup
         lbl = ep.label
@@ -183,7 +204,7 @@ def _make_mrs_isograph(x, properties):
         # scope labels (may be targets of arguments or hcons)
         g[lbl][id] = 'eq-scope'
         # predicate-argument structure
-        s = predicate.normalize(ep.predicate)
+        s = normalize(ep.predicate)
         if carg is not None:
             s += f'({carg})'
         elif properties and props:
@@ -194,7 +215,7 @@ def _make_mrs_isograph(x, properties):
             s += '{' + '|'.join(proplist) + '}'
         g[id][None] = s
         for role in args:
-            if role != mrs.CONSTANT_ROLE:
+            if role != CARG:
                 # there may be multiple roles (e.g., L-INDEX, L-HNDL, etc.)
                 roles = g[id].get(args[role], '').split() + [role]
                 g[id][args[role]] = ' '.join(sorted(roles))
@@ -233,13 +254,17 @@ def compare_bags(testbag: Iterable[mrs.MRS],
         *count_only* parameter is `True`, or a list of MRS objects
         otherwise.
     """
-    gold_remaining = list(goldbag)
+    # Each MRS is compared with many others, so build its isomorphism
+    # graph and a cheap signature once. Only MRSs with equal
+    # signatures need the full isomorphism check.
+    gold_remaining = [_BagItem(gold, properties) for gold in goldbag]
     test_unique = []
     shared = []
     for test in testbag:
+        item = _BagItem(test, properties)
         gold_match = None
         for gold in gold_remaining:
-            if is_isomorphic(test, gold, properties=properties):
+            if item.is_isomorphic(gold):
                 gold_match = gold
                 break
         if gold_match is not None:
@@ -250,7 +275,30 @@ def compare_bags(testbag: Iterable[mrs.MRS],
     if count_only:
         return (len(test_unique), len(shared), len(gold_remaining))
     else:
-        return (test_unique, shared, gold_remaining)
+        return (test_unique, shared, [gold.mrs for gold in gold_remaining])
+
+
+class _BagItem(object):
+    """An MRS with its isomorphism graph and signature for bag comparison."""
+
+    __slots__ = ('mrs', 'graph', 'signature')
+
+    def __init__(self, m, properties):
+        g = _make_mrs_isograph(m, properties)
+        self.mrs = m
+        self.signature = (
+            len(m.rels), len(m.hcons), len(m.icons), len(m.variables),
+            # node data must be matched one-to-one in any isomorphism
+            tuple(sorted(g[ep.id][None] for ep in m.rels)))
+        util._iso_inv_map(g)
+        self.graph = g
+
+    def is_isomorphic(self, other):
+        if self.signature != other.signature:
+            return False
+        iso = util._iso_search(self.graph, other.graph,
+                               self.mrs.top, other.mrs.top)
+        return set(iso) == set(self.graph)
 
 
 def from_dmrs(d):
@@ -285,30 +333,35 @@ def from_dmrs(d):
 
     icons = None  # see https://github.com/delph-in/pydelphin/issues/220
 
+    quantifiers = d.quantifier_ids()
+
+    # local names for the per-node loop
+    new_var = vfac.new
+    LHEQ, QEQ = scope.LHEQ, scope.QEQ
+    ARG0, CARG, BODY = mrs.INTRINSIC_ROLE, mrs.CONSTANT_ROLE, mrs.BODY_ROLE
+
     rels = []
     for node in d.nodes:
         id = node.id
         label = id_to_lbl[id]
-        args = {mrs.INTRINSIC_ROLE: id_to_iv[id]}
-
-        for role, tgt in ns_args[id]:
-            args[role] = id_to_iv[tgt]
+        args = {ARG0: id_to_iv[id]}
+        args.update((role, id_to_iv[tgt]) for role, tgt in ns_args[id])
 
         for role, relation, tgt_label in sc_args[id]:
-            if relation == scope.LHEQ:
+            if relation == LHEQ:
                 args[role] = tgt_label
-            elif relation == scope.QEQ:
-                hole = vfac.new(H)
+            elif relation == QEQ:
+                hole = new_var(H)
                 args[role] = hole
                 hcons.append(qeq(hole, tgt_label))
             else:
                 raise mrs.MRSError('DMRS-to-MRS: invalid scope constraint')
 
         if node.carg is not None:
-            args[mrs.CONSTANT_ROLE] = node.carg
+            args[CARG] = node.carg
 
-        if d.is_quantifier(id) and mrs.BODY_ROLE not in args:
-            args[mrs.BODY_ROLE] = vfac.new(H)
+        if id in quantifiers and BODY not in args:
+            args[BODY] = new_var(H)
 
         rels.append(
             mrs.EP(node.predicate,
@@ -590,8 +590,14 @@ def _compile(pattern):
             raise
 
 
+# Zero-filled maps are created for every rule that does not apply, so
+# build them by repeating a one-item array, which avoids creating an
+# intermediate list.
+_ZERO = array('i', [0])
+
+
 def _zeromap(s):
-    return array('i', [0] * (len(s) + 2))
+    return _ZERO * (len(s) + 2)
 
 
 def _mergemap(map1, map2):
@@ -600,7 +606,7 @@ def _mergemap(map1, map2):
     the equivalent position in map1. E.g., the i'th position in map2
     corresponds to the i + map2[i] position in map1.
     """
-    merged = array('i', [0] * len(map2))
+    merged = _ZERO * len(map2)
     for i, shift in enumerate(map2):
         newshift = shift + map1[i + shift]
         merged[i] = newshift
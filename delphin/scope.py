@@ -5,6 +5,7 @@ Structures and operations for quantifier scope in DELPH-IN semantics.
 """
 
 from typing import (Optional, Mapping, Iterable, List, Tuple, Dict)
+from collections import Counter
 
 from delphin.lnk import Lnk
 from delphin.sembase import (
@@ -243,14 +244,22 @@ def representatives(x: ScopingSemanticStructure, priority=None) -> ScopeMap:
         if len(scope) == 1:
             reps[label].extend(scope)
         else:
+            ids = {p.id for p in scope}
+            # count how many predications in the scope have each
+            # descendant so a predication's own can be discounted
+            desc_counts: Counter = Counter()
+            for id in ids:
+                desc_counts.update(descs[id])
             for predication in scope:
-                others = [p.id for p in scope if p is not predication]
                 args = ns_args[predication.id]
                 # check if args are in the immediate scope
-                if args.intersection(others):
+                immediate = args.intersection(ids)
+                immediate.discard(predication.id)
+                if immediate:
                     continue
-                # check if args are in scope descendants
-                if any(args.intersection(descs[id]) for id in others):
+                # check if args are in the descendants of the others
+                own = descs[predication.id]
+                if any(desc_counts[arg] > (arg in own) for arg in args):
                     continue
                 # tests passed; predication is a candidate representative
                 reps[label].append(predication)
@@ -279,7 +288,8 @@ def _make_representative_priority(x: ScopingSemanticStructure):
         id = p.id
         type = p.type
 
-        if x.is_quantifier(id) or type == 'x':
+        # check the type first as is_quantifier() may be expensive
+        if type == 'x' or x.is_quantifier(id):
             rank = 0
         elif type == 'e':
             tense = x.properties(id).get('TENSE', '').lower()
@@ -60,34 +60,48 @@ def safe_int(x):
 def _bfs(g, start=None):
     if not g:
         return {start} if start is not None else set()
-    seen = set()
     if start is None:
         start = next(iter(g))
-    agenda = deque([start])
-    while agenda:
-        x = agenda.popleft()
-        if x not in seen:
-            seen.add(x)
-            agenda.extend(y for y in g.get(x, []) if y not in seen)
+    # a plain list serves as the queue: iterating over it while
+    # appending visits nodes in breadth-first order without the
+    # overhead of deque.popleft() or per-level set operations
+    seen = {start}
+    queue = [start]
+    for x in queue:
+        for y in g.get(x, ()):
+            if y not in seen:
+                seen.add(y)
+                queue.append(y)
     return seen
 
 
 def _connected_components(nodes, edges):
     if not edges:
         return [{node} for node in nodes]
-    g = {n: set() for n in nodes}
+    # union-find over the nodes with path compression
+    parent = {n: n for n in nodes}
+
+    def find(x):
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while x != root:
+            parent[x], x = root, parent[x]
+        return root
+
     for n1, n2 in edges:
-        g[n1].add(n2)
-        g[n2].add(n1)
-    # find connected components
-    components = []
-    seen = set()
+        r1, r2 = find(n1), find(n2)
+        if r1 != r2:
+            parent[r2] = r1
+    # group by root, keeping components in order of their first node
+    components = {}
     for n in nodes:
-        if n not in seen:
-            component = _bfs(g, n)
-            seen.update(component)
-            components.append(component)
-    return components
+        root = find(n)
+        if root in components:
+            components[root].add(n)
+        else:
+            components[root] = {n}
+    return list(components.values())
 
 
 def _isomorphism(g1, g2, top1, top2) -> Dict[str, str]:
@@ -105,7 +119,17 @@ def _isomorphism(g1, g2, top1, top2) -> Dict[str, str]:
     """
     _iso_inv_map(g1)
     _iso_inv_map(g2)
+    return _iso_search(g1, g2, top1, top2)
+
+
+def _iso_search(g1, g2, top1, top2) -> Dict[str, str]:
+    """
+    Return the first isomorphism found for graphs *g1* and *g2*.
 
+    Unlike :func:`_isomorphism`, *g1* and *g2* must already be
+    augmented with inverse mappings (see :func:`_iso_inv_map`), and
+    they are not modified, so they may be reused for many searches.
+    """
     hypothesis: Dict[str, str] = {}
     agenda: List[Tuple[str, str]] = next(
         _iso_candidates({top1: None}, {top2: None}, g1, g2, hypothesis),
@@ -123,9 +147,7 @@ def _iso_inv_map(d):
     for src, d2 in d.items():
         for tgt, data in d2.items():
             if tgt is not None and src != tgt:
-                if tgt not in _d:
-                    _d[tgt] = {}
-                _d[tgt][src] = '--' + data
+                _d.setdefault(tgt, {})[src] = '--' + data
     for k, d2 in _d.items():
         d[k].update(d2)
 
@@ -567,6 +589,18 @@ def namespace_modules(ns):
             for _, name, _ in pkgutil.iter_modules(ns.__path__)}
 
 
+_codec_names = None
+
+
+def _codec_modules():
+    """Return the codec name to fullname mapping, found on first use."""
+    global _codec_names
+    if _codec_names is None:
+        import delphin.codecs
+        _codec_names = namespace_modules(delphin.codecs)
+    return _codec_names
+
+
 def inspect_codecs():
     """
     Inspect all available codecs and return a description.
@@ -578,8 +612,7 @@ def inspect_codecs():
     representation will be ``(ERROR)``, the module will be ``None``,
     and the description will be the exception message.
     """
-    import delphin.codecs
-    codecs = namespace_modules(delphin.codecs)
+    codecs = _codec_modules()
     result = defaultdict(list)
     for name, fullname in codecs.items():
         try:
@@ -597,9 +630,7 @@ def import_codec(name: str):
     """
     Import codec *name* and return the module.
     """
-    import delphin.codecs
-    codecs = namespace_modules(delphin.codecs)
-    fullname = codecs[name]
+    fullname = _codec_modules()[name]
     return importlib.import_module(fullname)
 
 
@@ -5,6 +5,7 @@ Functions for working with MRS variables.
 """
 
 import re
+from functools import lru_cache
 
 # Default modules need to import the PyDelphin version
 from delphin.__about__ import __version__  # noqa: F401
@@ -33,6 +34,13 @@ def split(var):
         >>> variable.split('ref-ind12')
         ('ref-ind', '12')
     """
+    return _split(var)
+
+
+# The same few variables are split many times when building and
+# inspecting a semantic structure, so successful splits are cached.
+@lru_cache(maxsize=1024)
+def _split(var):
     match = _variable_re.match(var)
     if match is None:
         raise ValueError(f'Invalid variable string: {var!s}')
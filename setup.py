@@ -11,7 +11,7 @@ with open(os.path.join(base_dir, "delphin", "__about__.py")) as f:
 with open(os.path.join(base_dir, 'README.md'), encoding='utf-8') as f:
     long_description = f.read()
 
-repp_requires = ['regex==2020.1.8']
+repp_requires = ['regex >= 2020.1.8']
 
 # thanks: https://snarky.ca/clarifying-pep-518/
 doc_requirements = os.path.join(base_dir, 'docs', 'requirements.txt')
@@ -62,7 +62,7 @@ setup(
         'delphin.web',
     ],
     install_requires=[
-        'penman==0.9.1',
+        'penman ~= 0.9.1',
     ],
     extras_require={
         'docs': docs_require,
@@ -73,7 +73,7 @@ setup(
             'wheel >= 0.31.0',
             'twine >= 1.11.0'
         ],
-        'web': ['requests==2.22.0', 'falcon==2.0.0'],
+        'web': ['requests ~= 2.22', 'falcon ~= 2.0'],
         'repp': repp_requires,
     },
     entry_points={
@@ -2,12 +2,14 @@
 from __future__ import unicode_literals
 
 import io
+import os
 import pathlib
 
 import pytest
 
 from delphin.commands import (
     convert,
+    convert_iter,
     mkprof,
     process,
     select,
@@ -98,6 +100,95 @@ def test_convert(dir_with_mrs, mini_testsuite, ace_output, ace_tsdb_stdout,
     convert(ex, 'simplemrs', 'eds', predicate_modifiers=True)
 
 
+def test_convert_empty_values(tmp_path):
+    ts = tmp_path.joinpath('ts')
+    ts.mkdir()
+    ts.joinpath('relations').write_text(
+        'result:\n'
+        '  parse-id :integer :key\n'
+        '  mrs :string\n')
+    ts.joinpath('result').write_text(
+        '10@\n'
+        '20@[ TOP: h0 RELS: < [ _rain_v_1<3:9> LBL: h1 ARG0: e2 ] >'
+        ' HCONS: < h0 qeq h1 > ]\n')
+    assert convert(str(ts), 'simplemrs', 'simplemrs', lnk=False) == (
+        '[ TOP: h0 RELS: < [ _rain_v_1 LBL: h1 ARG0: e2 ] >'
+        ' HCONS: < h0 qeq h1 > ]')
+    assert convert(str(ts), 'simplemrs', 'eds', lnk=False) == (
+        '{e2: e2:_rain_v_1{e}[]}')
+
+
+def test_convert_json_list_values(tmp_path):
+    # convert --to mrs-json writes a JSON list
+    mrs_json = convert(
+        io.StringIO('[ TOP: h0 RELS: < [ _rain_v_1 LBL: h1 ARG0: e2 ] >'
+                    ' HCONS: < h0 qeq h1 > ]'),
+        'simplemrs', 'mrs-json')
+    assert mrs_json.startswith('[')
+    ts = tmp_path.joinpath('ts')
+    ts.mkdir()
+    ts.joinpath('relations').write_text(
+        'result:\n'
+        '  parse-id :integer :key\n'
+        '  mrs :string\n')
+    ts.joinpath('result').write_text(f'10@{mrs_json}\n')
+    assert convert(str(ts), 'mrs-json', 'simplemrs') == (
+        '[ TOP: h0 RELS: < [ _rain_v_1 LBL: h1 ARG0: e2 ] >'
+        ' HCONS: < h0 qeq h1 > ]')
+
+
+def test_convert_semi(dir_with_mrs, tmp_path):
+    ex = str(pathlib.Path(dir_with_mrs, 'ex.mrs'))
+    smi = tmp_path.joinpath('a.smi')
+    smi.write_text(
+        'variables:\n'
+        '  u.\n'
+        '  i < u.\n'
+        '  p < u.\n'
+        '  h < p.\n'
+        '  e < i : TENSE tense.\n'
+        'properties:\n'
+        '  tense.\n'
+        '  past < tense.\n'
+        'roles:\n'
+        '  ARG0 : i.\n'
+        'predicates:\n'
+        '  _rain_v_1 : ARG0 e.\n')
+    out = convert(ex, 'simplemrs', 'indexedmrs', semi=str(smi))
+    assert out == convert(ex, 'simplemrs', 'indexedmrs', semi=smi)
+    assert convert(io.StringIO(out), 'indexedmrs', 'simplemrs', semi=smi)
+
+
+def test_load_semi_cache_includes(tmp_path):
+    from delphin.commands import _load_semi
+    smi = tmp_path.joinpath('top.smi')
+    smi.write_text('include: preds.smi\n')
+    preds = tmp_path.joinpath('preds.smi')
+    preds.write_text('predicates:\n  _a_q.\n')
+    semi = _load_semi(str(smi))
+    assert _load_semi(str(smi)) is semi
+    assert '_a_q' in semi.predicates
+    preds.write_text('predicates:\n  _the_q.\n')
+    st = preds.stat()
+    os.utime(str(preds), ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    semi = _load_semi(str(smi))
+    assert '_the_q' in semi.predicates
+    assert '_a_q' not in semi.predicates
+
+
+def test_convert_iter(dir_with_mrs, mini_testsuite):
+    ex = str(pathlib.Path(dir_with_mrs, 'ex.mrs'))
+    with pytest.raises(CommandError):
+        convert_iter(ex, 'invalid', 'simplemrs')
+    for fmt in ('simplemrs', 'mrx', 'dmrs-json', 'eds'):
+        assert ''.join(convert_iter(ex, 'simplemrs', fmt)) == convert(
+            ex, 'simplemrs', fmt)
+        assert ''.join(convert_iter(ex, 'simplemrs', fmt, indent=2)) == (
+            convert(ex, 'simplemrs', fmt, indent=2))
+    assert ''.join(convert_iter(mini_testsuite, 'simplemrs', 'mrx')) == (
+        convert(mini_testsuite, 'simplemrs', 'mrx'))
+
+
 def _bidi_convert(d, srcfmt, tgtfmt):
     src = pathlib.Path(d, 'ex.mrs')
     tgt = pathlib.Path(d, 'ex.out')
@@ -142,6 +233,36 @@ def test_mkprof(mini_testsuite, empty_alt_testsuite,
     assert item.with_suffix('.gz').is_file()
 
 
+def test_mkprof_skeleton(mini_testsuite, sentence_file, tmp_path):
+    ts1 = tmp_path.joinpath('ts1')
+    mkprof(str(ts1), source=mini_testsuite, skeleton=True, quiet=True)
+    assert sorted(p.name for p in ts1.iterdir()) == ['item', 'relations']
+    ts2 = tmp_path.joinpath('ts2')
+    relations = str(pathlib.Path(mini_testsuite, 'relations'))
+    mkprof(str(ts2), source=str(sentence_file), schema=relations,
+           skeleton=True, quiet=True)
+    assert sorted(p.name for p in ts2.iterdir()) == ['item', 'relations']
+    empty = tmp_path.joinpath('empty.txt')
+    empty.write_text('')
+    ts3 = tmp_path.joinpath('ts3')
+    mkprof(str(ts3), source=str(empty), schema=relations,
+           skeleton=True, quiet=True)
+    assert sorted(p.name for p in ts3.iterdir()) == ['relations']
+
+
+def test_mkprof_delimiter(mini_testsuite, tmp_path, monkeypatch):
+    ts1 = str(tmp_path.joinpath('ts1'))
+    relations = str(pathlib.Path(mini_testsuite, 'relations'))
+    with monkeypatch.context() as m:
+        m.setattr('sys.stdin', io.StringIO('i-id@i-input\n1@a\n2@b\n'))
+        mkprof(ts1, schema=relations, delimiter='@', quiet=True)
+    assert pathlib.Path(ts1, 'item').read_text().startswith('1@a@')
+    with monkeypatch.context() as m:
+        m.setattr('sys.stdin', io.StringIO('i-id@i-input\n1@a\n2@b\n1@c\n'))
+        with pytest.raises(CommandError):
+            mkprof(ts1, schema=relations, delimiter='@', quiet=True)
+
+
 def test_mkprof_issue_273(mini_testsuite, tmp_path):
     # https://github.com/delph-in/pydelphin/issues/273
     from delphin import itsdb
@@ -201,7 +322,10 @@ def test_compare(mini_testsuite):
         compare(ts0)
     with pytest.raises(TypeError):
         compare(gold=ts0)
-    compare(ts0, ts0)
+    results = list(compare(ts0, ts0))
+    assert all(r['test'] == r['gold'] == 0 for r in results)
+    assert [r['shared'] for r in results] == [1, 1]
+    assert [r['input'] for r in results] == ['It rained.', 'It snowed.']
 
 
 def test_repp(sentence_file):
@@ -211,3 +335,25 @@ def test_repp(sentence_file):
     with pytest.raises(CommandError):
         repp(sentence_file, config='x', active=['y'])
     repp(sentence_file)
+
+
+def test_repp_processes(sentence_file, capsys):
+    sentence_file = str(sentence_file)
+    for fmt in ('yy', 'string', 'line', 'triple'):
+        repp(sentence_file, format=fmt)
+        serial = capsys.readouterr().out
+        repp(sentence_file, format=fmt, processes=2)
+        assert capsys.readouterr().out == serial
+
+
+def test_repp_processes_tokenizer(tmp_path, capsys):
+    # the module's own tokenizer pattern is not used by repp()
+    module = tmp_path.joinpath('tok.rpp')
+    module.write_text(':[ \t,]+\n!a\tb\n')
+    source = tmp_path.joinpath('sents.txt')
+    source.write_text('x,y a\n')
+    repp(str(source), module=str(module), format='string')
+    serial = capsys.readouterr().out
+    assert serial == 'x,y b\n'
+    repp(str(source), module=str(module), format='string', processes=2)
+    assert capsys.readouterr().out == serial
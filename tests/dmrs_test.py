@@ -116,6 +116,31 @@ class TestDMRS():
             10002: []
         }
 
+    def test_quantifier_ids(self, dogs_bark):
+        assert dmrs.DMRS().quantifier_ids() == set()
+        d = dmrs.DMRS(**dogs_bark)
+        assert d.quantifier_ids() == {10001}
+
+    def test_scopes(self, dogs_bark):
+        d = dmrs.DMRS()
+        assert d.scopes() == (None, {})
+
+        d = dmrs.DMRS(**dogs_bark)
+        top, scopes = d.scopes()
+        assert len(scopes) == 3
+        assert [node.id for node in scopes[top]] == [10000]
+
+        # equal nodes in separate scopes
+        d = dmrs.DMRS(
+            top=10001,
+            nodes=[dmrs.Node(10000, '_rain_v_1', type='e'),
+                   dmrs.Node(10001, '_rain_v_1', type='e'),
+                   dmrs.Node(10002, '_heavy_a_1', type='e')],
+            links=[dmrs.Link(10002, 10001, 'ARG1', 'EQ')])
+        top, scopes = d.scopes()
+        assert len(scopes) == 2
+        assert sorted(node.id for node in scopes[top]) == [10001, 10002]
+
     def test_scopal_arguments(self, dogs_bark):
         d = dmrs.DMRS()
         assert d.scopal_arguments() == {}
@@ -1,3 +1,4 @@
+import json
 
 from delphin.interface import Response, Result
 from delphin.codecs import (
@@ -49,6 +50,9 @@ def test_Result():
     assert r['mrs'] == mrs_d
     assert r.mrs() == mrs
 
+    r = Result(mrs=json.dumps(mrs_d))
+    assert r.mrs() == mrs
+
     # r = Result(mrs='nonsense')
     # assert r['mrs'] == 'nonsense'
     # with pytest.raises(PyDelphinSyntaxError):
@@ -70,6 +74,9 @@ def test_Result():
     assert r['dmrs'] == dmrs_d
     assert r.dmrs() == dmrs
 
+    r = Result(dmrs=json.dumps(dmrs_d))
+    assert r.dmrs() == dmrs
+
     # r = Result(dmrs='nonsense')
     # assert len(r) == 1
     # assert r['dmrs'] == 'nonsense'
@@ -99,6 +106,9 @@ def test_Result():
     assert r['eds'] == eds_d
     assert r.eds() == eds
 
+    r = Result(eds=json.dumps(eds_d))
+    assert r.eds() == eds
+
     # r = Result(eds='nonsense')
     # assert len(r) == 1
     # assert r['eds'] == 'nonsense'
@@ -134,6 +144,12 @@ def test_Result():
     assert len(r) == 1
     assert r['derivation'] == deriv_d
     assert r.derivation() == deriv
+    assert r.tree() == ['S', ['', ['it']], ['', ['', ['', ['rained.']]]]]
+
+    deriv_d['daughters'][1]['label'] = 'VP'
+    deriv_d['daughters'][0]['label'] = 'NP'
+    r = Result(derivation=deriv_d)
+    assert r.tree() == ['S', ['NP', ['it']], ['VP', ['', ['', ['rained.']]]]]
 
 
 def test_Response():
@@ -151,6 +167,8 @@ def test_Response():
     assert r['results'] == [{}]
     assert isinstance(r.results()[0], Result)
     assert isinstance(r.result(0), Result)
+    assert [type(x) for x in r.iter_results()] == [Result]
+    assert list(Response().iter_results()) == []
 
     toks_s = '(1, 0, 1, <0:4>, 1, "Dogs", 0, "null")'
     toks_d = [
@@ -173,3 +191,51 @@ def test_Response():
     assert r.tokens('initial') is None
     assert r.tokens('internal') == toks
     assert r.tokens() == toks
+    assert r.tokens() is r.tokens()
+
+
+def test_Result_cache():
+    mrs_s = ('[ TOP: h0'
+             '  RELS: < ["_rain_v_1_rel" LBL: h1 ARG0: e2 ] >'
+             '  HCONS: < h0 qeq h1 > ]')
+    r = Result(mrs=mrs_s, tree='(S (NP it) (VP rained))')
+    m = r.mrs()
+    assert r.mrs() is m
+    t = r.tree()
+    assert r.tree() is t
+    r['mrs'] = mrs_s.replace('_rain_v_1_rel', '_snow_v_1_rel')
+    assert r.mrs() is not m
+    assert r.mrs().rels[0].predicate == '_snow_v_1'
+    del r['mrs']
+    assert r.mrs() is None
+
+
+def test_Result_pickle():
+    import pickle
+    r = Result(tree='(S (NP it) (VP rained))')
+    t = r.tree()
+    r2 = pickle.loads(pickle.dumps(r))
+    assert type(r2) is Result
+    assert r2 == r
+    assert r2.tree() == t
+    assert not hasattr(r, '__dict__')
+    assert not hasattr(Response(), '__dict__')
+
+
+def test_repr():
+    assert repr(Result(mrs='[ ]')) == "Result({'mrs': '[ ]'})"
+    assert repr(Response()) == 'Response({})'
+    assert len(repr(Result(mrs='x' * 10000))) < 200
+    # keys are neither sorted nor dropped
+    keys = ['run', 'results', 'keys'] + [f'k{i}' for i in range(20)]
+    r = Response({key: 1 for key in keys})
+    assert repr(r) == 'Response({})'.format(dict.__repr__(r))
+    # nested strings are abbreviated too
+    r = Response(results=[{'mrs': 'x' * 5000}],
+                 tokens={'internal': 'y' * 5000})
+    assert len(repr(r)) < 400
+    assert repr(r).startswith("Response({'results': [{'mrs': 'xxx")
+    # self-references do not recurse
+    r = Response(run={})
+    r['self'] = r
+    assert repr(r) == "Response({'run': {}, 'self': {...}})"
@@ -113,6 +113,43 @@ class TestTestSuite(object):
         assert len(responses[2].results()) == 1
 
 
+def test_FieldMapper():
+    from delphin.interface import Response
+    fm = itsdb.FieldMapper()
+    end = datetime(2020, 1, 1)
+    for i_id, run_id in [(10, 2), (20, 2), (30, 0), (40, 1)]:
+        response = Response(keys={'i-id': i_id},
+                            run={'run-id': run_id, 'end': end},
+                            results=[{'result-id': 0, 'mrs': '[ ]'}],
+                            readings=1,
+                            bogus=True)
+        transaction = fm.map(response)
+        assert [name for name, _ in transaction] == ['parse', 'result']
+        parse = transaction[0][1]
+        assert parse['i-id'] == parse['parse-id'] == i_id
+        assert parse['run-id'] == run_id
+        assert parse['readings'] == 1
+        assert 'bogus' not in parse
+        assert transaction[1][1] == {
+            'parse-id': i_id, 'result-id': 0, 'mrs': '[ ]'}
+        assert list(transaction[1][1]) == ['parse-id', 'result-id', 'mrs']
+    runs = fm.cleanup()
+    assert [d['run-id'] for _, d in runs] == [0, 1, 2]
+    assert fm.cleanup() == []
+
+    # subclasses overriding _map_result() receive Result objects
+    from delphin.interface import Result
+
+    class ResultFieldMapper(itsdb.FieldMapper):
+        def _map_result(self, result, parse_id):
+            assert isinstance(result, Result)
+            return super()._map_result(result, parse_id)
+
+    transaction = ResultFieldMapper().map(
+        Response(results=[{'result-id': 0, 'mrs': '[ ]'}]))
+    assert transaction[1][1]['mrs'] == '[ ]'
+
+
 def test_Row(empty_alt_testsuite):
     ts = itsdb.TestSuite(str(empty_alt_testsuite))
     item = ts['item']
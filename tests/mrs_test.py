@@ -83,6 +83,15 @@ class TestMRS():
             'h6': {},
             'h7': {}}
 
+        # rels may be any iterable
+        m = mrs.MRS(rels=iter(dogs_bark['rels']))
+        assert len(m.rels) == 3
+
+        # duplicate ids are made unique
+        m = mrs.MRS(rels=[mrs.EP('_rain_v_1', 'h1', {'ARG0': 'e2'}),
+                          mrs.EP('_rain_v_1', 'h1', {'ARG0': 'e2'})])
+        assert [ep.id for ep in m.rels] == ['e2', '_2']
+
 
 @pytest.fixture
 def m1():
@@ -294,6 +303,41 @@ def test_is_isomorphic_pathological2(pathological1, pathological2):
     assert not mrs.is_isomorphic(pathological1, pathological2)
 
 
+def test_compare_bags(m1, m1b, m1c, m1f, m2):
+    assert mrs.compare_bags([m1], [m1b]) == (0, 1, 0)
+    assert mrs.compare_bags([m1, m1c], [m1b]) == (1, 1, 0)
+    assert mrs.compare_bags([m1, m1c], [m1b], properties=False) == (1, 1, 0)
+    assert mrs.compare_bags([m1, m2], [m1f, m2, m1b]) == (0, 2, 1)
+    assert mrs.compare_bags([], [m1]) == (0, 0, 1)
+    test_unique, shared, gold_unique = mrs.compare_bags(
+        [m1c, m1], [m1b, m1f], count_only=False)
+    assert test_unique == [m1c]
+    assert shared == [m1]
+    assert gold_unique == [m1f]
+
+
+def test_is_connected(dogs_bark):
+    m = mrs.MRS(**dogs_bark)
+    assert mrs.is_connected(m)
+    assert mrs.is_well_formed(m)
+    # without ARG1, _bark_v_1 is disconnected
+    m.rels[0].args = {'ARG0': 'e2'}
+    assert not mrs.is_connected(mrs.MRS(**dogs_bark))
+    m = mrs.MRS(**dogs_bark)
+    m.rels[0].label = 'h6'  # label equality reconnects it
+    assert mrs.is_connected(m)
+
+
+def test_quantification_pairs(dogs_bark):
+    m = mrs.MRS(**dogs_bark)
+    pairs = [(p.predicate, q.predicate if q else None)
+             for p, q in m.quantification_pairs()]
+    assert pairs == [('_bark_v_1', None), ('_dog_n_1', 'udef_q')]
+    m.rels.append(mrs.EP('the_q', 'h8', args={'ARG0': 'x9', 'RSTR': 'h10'}))
+    m = mrs.MRS(m.top, m.index, m.rels, m.hcons)
+    assert m.quantification_pairs()[-1] == (None, m.rels[-1])
+
+
 def test_from_dmrs(dogs_bark):
     from delphin import dmrs
     m = mrs.MRS(**dogs_bark)
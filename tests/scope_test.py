@@ -24,4 +24,23 @@ def test_tree_fragments():
 
 
 def test_representatives():
-    pass
+    from delphin import mrs
+    # "very old book"
+    m = mrs.MRS(
+        top='h0', index='x3',
+        rels=[mrs.EP('_very_x_deg', 'h1', {'ARG0': 'e4', 'ARG1': 'e5'}),
+              mrs.EP('_old_a_1', 'h1', {'ARG0': 'e5', 'ARG1': 'x3'}),
+              mrs.EP('_book_n_of', 'h1', {'ARG0': 'x3', 'ARG1': 'i6'})],
+        hcons=[mrs.HCons.qeq('h0', 'h1')])
+    reps = scope.representatives(m)
+    assert [ep.predicate for ep in reps['h1']] == ['_book_n_of']
+    # _b takes _c, a scopal descendant of _a, so only _a represents h1
+    m = mrs.MRS(
+        top='h0', index='e2',
+        rels=[mrs.EP('_a', 'h1', {'ARG0': 'e2', 'ARG1': 'h5'}),
+              mrs.EP('_b', 'h1', {'ARG0': 'e3', 'ARG1': 'x9'}),
+              mrs.EP('_c', 'h6', {'ARG0': 'x9'})],
+        hcons=[mrs.HCons.qeq('h0', 'h1'), mrs.HCons.qeq('h5', 'h6')])
+    reps = scope.representatives(m)
+    assert [ep.predicate for ep in reps['h1']] == ['_a']
+    assert [ep.predicate for ep in reps['h6']] == ['_c']
@@ -1,6 +1,7 @@
 # coding: utf-8
 
 from delphin.util import safe_int, SExpr, detect_encoding, LookaheadIterator
+from delphin.util import _bfs, _connected_components
 
 import pytest, codecs
 
@@ -10,6 +11,21 @@ def test_safe_int():
     assert safe_int('-12345') == -12345
     assert safe_int('1a') == '1a'
 
+def test__bfs():
+    assert _bfs({}) == set()
+    assert _bfs({}, start=1) == {1}
+    g = {1: {2}, 2: {1, 3}, 3: {2}, 4: {5}, 5: {4}}
+    assert _bfs(g) == {1, 2, 3}
+    assert _bfs(g, start=5) == {4, 5}
+    assert _bfs(g, start=6) == {6}
+    # directed edges and cycles
+    assert _bfs({1: [2], 2: [3], 3: [1, 4]}, start=2) == {1, 2, 3, 4}
+
+def test__connected_components():
+    assert _connected_components([1, 2], []) == [{1}, {2}]
+    assert _connected_components(
+        [1, 2, 3, 4], [(1, 2), (3, 4), (2, 1)]) == [{1, 2}, {3, 4}]
+
 def test_SExpr():
     # atoms outside of parens
     # assert SExpr.parse('a').data == 'a'